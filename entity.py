@@ -1,66 +1,111 @@
 from enum import Enum, auto
+from collections import defaultdict
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, product, repeat
+import math
 import random
 from typing import Dict, Any, List
 from fake import DatagenFaker
-from mergedeep import merge, Strategy
 import airportsdata
-from geopy.distance import geodesic
 
 # Group airports in turkey by city
 tr_airports = {iata: data for iata, data in airportsdata.load('IATA').items()  if data['country'] == 'TR' and iata in {'ADB', 'IST', 'TZX', 'AYT', 'GZT', 'ESB'}}
-airports_by_city = {}
+_airports_by_city = defaultdict(list)
 for airport_data in tr_airports.values():
-    city = airport_data['city']
-    if city not in airports_by_city:
-        airports_by_city[city] = []
-    airports_by_city[city].append(airport_data)
+    _airports_by_city[airport_data['city']].append(airport_data)
+airports_by_city = {city: tuple(airports) for city, airports in _airports_by_city.items()}
+del _airports_by_city
 
-def get_two_airports_in_distinct_cities_in_turkey() -> tuple[str, str]:
-    # Get list of cities that have airports
-    cities = list(airports_by_city.keys())
+# Cities that have airports, in a fixed order for sampling
+_CITIES = tuple(airports_by_city)
 
-    assert len(cities) > 2
+# Cities with a single airport need no second draw, so map them straight to its code
+_CITY_TO_IATA = {city: airports[0]['iata'] for city, airports in airports_by_city.items() if len(airports) == 1}
+
+def _draw_airport_in(city: str, rng: random.Random) -> str:
+    iata = _CITY_TO_IATA.get(city)
+    if iata is None:
+        iata = rng.choice(airports_by_city[city])['iata']
+    return iata
+
+def get_two_airports_in_distinct_cities_in_turkey(rng: random.Random = random) -> tuple[str, str]:
+    assert len(_CITIES) > 2
 
     # Randomly select two different cities
-    city1, city2 = random.sample(cities, 2)
+    city1, city2 = rng.sample(_CITIES, 2)
 
     # Randomly select one airport from each city
-    airport1 = random.choice(airports_by_city[city1])
-    airport2 = random.choice(airports_by_city[city2])
+    return _draw_airport_in(city1, rng), _draw_airport_in(city2, rng)
 
-    return airport1['iata'], airport2['iata']
+def get_airport_pairs_in_distinct_cities_in_turkey(n: int, rng: random.Random = random) -> list[tuple[str, str]]:
+    cities = _CITIES
+    k = len(cities)
 
-def calculate_flight_distance(departure_airport: str, arrival_airport: str) -> geodesic:
-    if departure_airport not in tr_airports or arrival_airport not in tr_airports:
-        raise ValueError("Invalid airport IATA code")
+    assert k > 2
+
+    # Offsetting the first city by 1..k-1 always lands on a different city, so no pair is redrawn
+    firsts = rng.choices(range(k), k=n)
+    offsets = rng.choices(range(1, k), k=n)
+
+    return [
+        (_draw_airport_in(cities[first], rng), _draw_airport_in(cities[(first + offset) % k], rng))
+        for first, offset in zip(firsts, offsets)
+    ]
+
+# Value ranges drawn per batch in the batch factory methods
+_EXPIRATION_MONTHS = range(1, 13)
+_EXPIRATION_YEARS = range(28, 41)
+_PLANE_STATUSES = ('active', 'inactive')
+
+# Mean Earth radius in kilometers
+_EARTH_RADIUS_KM = 6371.0088
 
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+def _calculate_distance_km(departure_airport: str, arrival_airport: str) -> float:
     # Get airport coordinates
     dep = tr_airports[departure_airport]
     arr = tr_airports[arrival_airport]
 
-    # Create coordinate tuples
-    dep_coords = (dep['lat'], dep['lon'])
-    arr_coords = (arr['lat'], arr['lon'])
+    # Great-circle distance, well under 1% off the ellipsoid for domestic flights
+    return _haversine_km(dep['lat'], dep['lon'], arr['lat'], arr['lon'])
 
-    # Calculate distance in kilometers
-    return geodesic(dep_coords, arr_coords)
+# The airport set is fixed, so compute the distance for every pair once instead of per flight
+_FLIGHT_DISTANCES = {(dep, arr): _calculate_distance_km(dep, arr) for dep, arr in product(tr_airports, repeat=2)}
 
-def calculate_flight_duration(departure_airport: str, arrival_airport: str, cruising_kmh: float = 920.0, fixed_time: float = timedelta(minutes=45)) -> timedelta:
-    distance = calculate_flight_distance(departure_airport, arrival_airport)
-    airtime = timedelta(hours=(distance.kilometers / cruising_kmh))
-    return airtime + fixed_time
+def calculate_flight_distance(departure_airport: str, arrival_airport: str) -> float:
+    """Return the distance between two airports in kilometers."""
+    try:
+        return _FLIGHT_DISTANCES[(departure_airport, arrival_airport)]
+    except KeyError:
+        raise ValueError("Invalid airport IATA code")
 
-def calculate_flight_price(departure_airport: str, arrival_airport: str, base_price: float = 100.0, price_per_km: float = 5.52) -> float:
-    # Calculate distance
-    distance = calculate_flight_distance(departure_airport, arrival_airport)
+def _flight_duration(distance_km: float, cruising_kmh: float = 920.0, fixed_time: timedelta = timedelta(minutes=45)) -> timedelta:
+    airtime = timedelta(hours=(distance_km / cruising_kmh))
+    return airtime + fixed_time
 
+def _flight_price(distance_km: float, base_price: float = 100.0, price_per_km: float = 5.52, rng: random.Random = random) -> float:
     # Calculate price: base_price + (distance * price_per_km)
-    price = base_price + (distance.kilometers * price_per_km) + random.uniform(-200, 200)
+    price = base_price + (distance_km * price_per_km) + rng.uniform(-200, 200)
 
     # Round to 2 decimal places
     return round(price, 2)
 
+# Durations only depend on the distance, so they are precomputed per airport pair alongside it
+_FLIGHT_LEGS = {pair: (distance_km, _flight_duration(distance_km)) for pair, distance_km in _FLIGHT_DISTANCES.items()}
+
+def calculate_flight_duration(departure_airport: str, arrival_airport: str, cruising_kmh: float = 920.0, fixed_time: timedelta = timedelta(minutes=45)) -> timedelta:
+    distance_km = calculate_flight_distance(departure_airport, arrival_airport)
+    return _flight_duration(distance_km, cruising_kmh, fixed_time)
+
+def calculate_flight_price(departure_airport: str, arrival_airport: str, base_price: float = 100.0, price_per_km: float = 5.52, rng: random.Random = random) -> float:
+    distance_km = calculate_flight_distance(departure_airport, arrival_airport)
+    return _flight_price(distance_km, base_price, price_per_km, rng)
+
 class Entity(Enum):
     CREDITCARD = auto()
     EMPLOYEE = auto()
@@ -72,31 +117,82 @@ class Entity(Enum):
     @classmethod
     def from_string(cls, value: str) -> 'Entity':
         try:
-            return cls[value.upper()]
+            return _ENTITY_BY_NAME[value.casefold()]
         except KeyError:
-            raise ValueError(f"Invalid entity: {value}. Must be one of: {', '.join(e.name.lower() for e in cls)}")
+            raise ValueError(f"Invalid entity: {value}. Must be one of: {_ENTITY_NAMES}")
+
+# Lowercase entity names, for case-insensitive lookups in Entity.from_string
+_ENTITY_BY_NAME = {e.name.lower(): e for e in Entity}
+_ENTITY_NAMES = ', '.join(_ENTITY_BY_NAME)
+
+def _merge_overrides(entity_data: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply overrides onto freshly created entity data in place, recursing only into nested dicts."""
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(entity_data.get(key), dict):
+            _merge_overrides(entity_data[key], value)
+        else:
+            entity_data[key] = value
+    return entity_data
+
+def soa_to_aos(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Convert a dict of equally long columns into a list of row dicts."""
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+def _set_column(entities: List[Dict[str, Any]], path: tuple[str, ...], values: List[Any]) -> None:
+    """Set the field at path, a key per nesting level, of each entity to the matching value."""
+    *parents, key = path
+    for entity_data, value in zip(entities, values):
+        for parent in parents:
+            entity_data = entity_data[parent]
+        entity_data[key] = value
+
+def _create_entities_worker(entity_name: str, amount: int, seed: int, unique_columns: Dict[tuple[str, ...], List[Any]], kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Create a shard of entities inside a worker process with its own seeded factory.
+
+    The worker's faker only knows the values it drew itself, so the unique fields are
+    replaced with the shard's slice of the values the parent drew for all shards.
+    """
+    entities = EntityFactory(seed).create_entities(Entity[entity_name], amount)
+    for path, values in unique_columns.items():
+        _set_column(entities, path, values)
+    if kwargs:
+        for entity_data in entities:
+            _merge_overrides(entity_data, kwargs)
+    return entities
 
 class EntityFactory:
     """A factory class for creating different types of entities with fake data."""
 
-    def __init__(self):
-        """Initialize the factory"""
-        self.fake = DatagenFaker()
-
-    def create_entity(self, entity_type: Entity, **kwargs) -> Dict[str, Any]:
-        """Create an entity of the specified type with fake data."""
-        factory_method = self._get_factory_method(entity_type)
-        entity_data = factory_method()
-        return merge(entity_data, kwargs, strategy = Strategy.REPLACE)
-
-    def create_entities(self, entity_type: Entity, amount: int, **kwargs) -> List[Dict[str, Any]]:
-        """Create an entity of the specified type with fake data."""
-        factory_method = self._get_factory_method(entity_type)
-        return [merge(factory_method(), kwargs, strategy = Strategy.REPLACE) for _ in range(0, amount)]
-
-    def _get_factory_method(self, entity_type: Entity):
-        """Return the corresponding factory method for entity type."""
-        factory_map = {
+    # Below this amount forking workers costs more than it saves
+    PARALLEL_THRESHOLD = 1000
+
+    # Faker shared by all unseeded factories, created on first use
+    _shared_fake = None
+
+    def __init__(self, seed: int | None = None):
+        """Initialize the factory, with a seed to make the generated data reproducible"""
+        # One RNG per factory, so seeded factories are independent streams
+        self._rng = random.Random(seed)
+        self._choice = self._rng.choice
+        self._choices = self._rng.choices
+        if seed is None:
+            # Unseeded factories share one faker, and with it its unique values
+            if EntityFactory._shared_fake is None:
+                EntityFactory._shared_fake = DatagenFaker()
+            self.fake = EntityFactory._shared_fake
+        else:
+            self.fake = DatagenFaker(reproducible=True)
+            self.fake.random = self._rng
+        # Resolve the unique providers once instead of on every generated value
+        self._unique_email = self.fake.unique.email
+        self._unique_card_numbers = self.fake.unique_card_numbers
+        self._unique_flight_numbers = self.fake.unique_flight_numbers
+        self._unique_numeric_plane_registrations = self.fake.unique_numeric_plane_registrations
+        self._unique_phone_numbers = self.fake.unique_phone_numbers
+        self._unique_plane_registrations = self.fake.unique_plane_registrations
+        self._unique_ssns = self.fake.unique_ssns
+        self._factory_map = {
             Entity.CREDITCARD: self._create_creditcard,
             Entity.EMPLOYEE: self._create_employee,
             Entity.FLIGHT: self._create_flight,
@@ -104,22 +200,115 @@ class EntityFactory:
             Entity.PLANE: self._create_plane,
             Entity.USER: self._create_user
         }
+        self._batch_factory_map = {
+            Entity.CREDITCARD: self._create_creditcard_batch,
+            Entity.EMPLOYEE: self._create_employee_batch,
+            Entity.FLIGHT: self._create_flight_batch,
+            Entity.PLANE: self._create_plane_batch,
+            Entity.USER: self._create_user_batch,
+        }
+        # Fields that must be unique across all entities of a type, with the provider drawing n of them
+        self._unique_field_map = {
+            Entity.CREDITCARD: {('card_number',): self._unique_card_numbers},
+            Entity.EMPLOYEE: {('national_id',): self._unique_ssns, ('email',): self._unique_emails, ('phone',): self._unique_phone_numbers},
+            Entity.FLIGHT: {('flight_number',): self._unique_flight_numbers, ('plane_registration',): self._unique_plane_registrations},
+            Entity.PASSENGER: {
+                ('passenger', 'national_id'): self._unique_ssns,
+                ('passenger', 'email'): self._unique_emails,
+                ('passenger', 'phone'): self._unique_phone_numbers,
+                ('credit_card', 'card_number'): self._unique_card_numbers,
+            },
+            Entity.PLANE: {('registration',): self._unique_numeric_plane_registrations},
+            Entity.USER: {('email',): self._unique_emails, ('phone',): self._unique_phone_numbers},
+        }
 
-        factory_method = factory_map.get(entity_type)
+    def create_entity(self, entity_type: Entity, **kwargs) -> Dict[str, Any]:
+        """Create an entity of the specified type with fake data."""
+        factory_method = self._get_factory_method(entity_type)
+        return _merge_overrides(factory_method(), kwargs)
+
+    def create_entities(self, entity_type: Entity, amount: int, workers: int = 1, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Create entities of the specified type with fake data.
+
+        With workers > 1 and a large enough amount, the rows are built in parallel
+        worker processes. The unique fields are still drawn here for all of them, so
+        they stay unique across the workers' shards.
+        """
+        if workers > 1 and amount >= self.PARALLEL_THRESHOLD:
+            shards = [amount // workers + (i < amount % workers) for i in range(workers)]
+            base_seed = self._rng.getrandbits(64)
+            seeds = [base_seed + i for i in range(workers)]
+            unique_columns = {path: draw(amount) for path, draw in self._unique_field_map[entity_type].items()}
+            starts = [sum(shards[:i]) for i in range(workers)]
+            shard_unique_columns = [
+                {path: values[start:start + shard] for path, values in unique_columns.items()}
+                for start, shard in zip(starts, shards)
+            ]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_create_entities_worker, repeat(entity_type.name), shards, seeds, shard_unique_columns, repeat(kwargs))
+                return list(chain.from_iterable(results))
+
+        batch_factory_method = self._get_batch_factory_method(entity_type)
+        if batch_factory_method is not None:
+            entities = soa_to_aos(batch_factory_method(amount))
+        else:
+            factory_method = self._get_factory_method(entity_type)
+            entities = [factory_method() for _ in repeat(None, amount)]
+
+        if kwargs:
+            # Only nested overrides need the recursive merge, flat ones are a plain update
+            merge = _merge_overrides if any(isinstance(value, dict) for value in kwargs.values()) else dict.update
+            for entity_data in entities:
+                merge(entity_data, kwargs)
+
+        return entities
+
+    def create_entities_with_overrides(self, entity_type: Entity, overrides: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create one entity of the specified type per overrides dict, with those overrides applied to it."""
+        entities = self.create_entities(entity_type, len(overrides))
+        for entity_data, entity_overrides in zip(entities, overrides):
+            _merge_overrides(entity_data, entity_overrides)
+        return entities
+
+    def create_entities_soa(self, entity_type: Entity, amount: int) -> Dict[str, List[Any]]:
+        """
+        Create entities of the specified type as a dict of columns instead of a list of rows.
+
+        Entities with a batch factory method are built column by column without
+        allocating a dict per row; the rest are built row by row and transposed.
+        """
+        batch_factory_method = self._get_batch_factory_method(entity_type)
+        if batch_factory_method is not None:
+            return batch_factory_method(amount)
 
-        if factory_method is None:
+        factory_method = self._get_factory_method(entity_type)
+        rows = [factory_method() for _ in repeat(None, amount)]
+        return {key: [row[key] for row in rows] for key in rows[0]} if rows else {}
+
+    def _get_factory_method(self, entity_type: Entity):
+        """Return the corresponding factory method for entity type."""
+        try:
+            return self._factory_map[entity_type]
+        except KeyError:
             raise ValueError(f"No factory method found for entity type: {entity_type.name}")
 
-        return factory_method
+    def _unique_emails(self, n: int) -> List[str]:
+        """Draw n unique emails at once, like the faker's unique_* providers."""
+        return [self._unique_email() for _ in repeat(None, n)]
+
+    def _get_batch_factory_method(self, entity_type: Entity):
+        """Return the batch factory method for entity type, or None if it only has a per-row one."""
+        return self._batch_factory_map.get(entity_type)
 
     def _create_employee(self) -> Dict[str, Any]:
         """Create an employee entity with fake data matching the specified format."""
         return {
-            "national_id": self.fake.unique.ssn(),
+            "national_id": self._unique_ssns(1)[0],
             "name": self.fake.first_name(),
             "surname": self.fake.last_name(),
-            "email": self.fake.unique.email(),
-            "phone": self.fake.unique.phone_number(),
+            "email": self._unique_email(),
+            "phone": self._unique_phone_numbers(1)[0],
             "gender": self.fake.gender(),
             "birth_date": self._format_datetime(self.fake.birth_date()),
             "password": "123",
@@ -127,37 +316,75 @@ class EntityFactory:
             "role": self.fake.role(),
         }
 
+    def _create_employee_batch(self, n: int) -> Dict[str, List[Any]]:
+        """Create the columns of n employee entities, drawing the names and categorical fields for the whole batch at once."""
+        return {
+            "national_id": self._unique_ssns(n),
+            "name": self.fake.first_names(n),
+            "surname": self.fake.last_names(n),
+            "email": self._unique_emails(n),
+            "phone": self._unique_phone_numbers(n),
+            "gender": self.fake.genders(n),
+            "birth_date": [self._format_datetime(dt) for dt in self.fake.birth_dates(n)],
+            "password": ["123"] * n,
+            "title": [self.fake.title() for _ in repeat(None, n)],
+            "role": self.fake.roles(n),
+        }
+
     def _create_flight(self) -> Dict[str, Any]:
         """Create a flight entity with fake data matching the schema."""
-        departure_airport, destination_airport = get_two_airports_in_distinct_cities_in_turkey()
-        flight_duration = calculate_flight_duration(departure_airport, destination_airport)
-        price = calculate_flight_price(departure_airport, destination_airport)
+        departure_airport, destination_airport = get_two_airports_in_distinct_cities_in_turkey(self._rng)
+        distance_km, flight_duration = _FLIGHT_LEGS[(departure_airport, destination_airport)]
+        price = _flight_price(distance_km, rng=self._rng)
         departure_datetime = self.fake.departure_datetime()
         arrival_datetime = departure_datetime + flight_duration
 
         return {
-            'flight_number': self.fake.unique.flight_number(),
+            'flight_number': self._unique_flight_numbers(1)[0],
             'departure_airport': departure_airport,
             'destination_airport': destination_airport,
             'departure_datetime': self._format_datetime(departure_datetime),
             'arrival_datetime': self._format_datetime(arrival_datetime),
             'departure_gate_number': self.fake.gate_number(),
             'destination_gate_number': self.fake.gate_number(),
-            'plane_registration': self.fake.unique.plane_registration(),
+            'plane_registration': self._unique_plane_registrations(1)[0],
             'price': price,
         }
 
+    def _create_flight_batch(self, n: int) -> Dict[str, List[Any]]:
+        """Create the columns of n flight entities, drawing the airport pairs and gates for the whole batch at once."""
+        airport_pairs = get_airport_pairs_in_distinct_cities_in_turkey(n, self._rng)
+        # Look each leg up once, its distance drives the price and its duration the arrival time
+        legs = [_FLIGHT_LEGS[airport_pair] for airport_pair in airport_pairs]
+        departure_datetimes = [self.fake.departure_datetime() for _ in repeat(None, n)]
+        arrival_datetimes = [
+            departure_datetime + duration
+            for departure_datetime, (_, duration) in zip(departure_datetimes, legs)
+        ]
+
+        return {
+            'flight_number': self._unique_flight_numbers(n),
+            'departure_airport': [departure_airport for departure_airport, _ in airport_pairs],
+            'destination_airport': [destination_airport for _, destination_airport in airport_pairs],
+            'departure_datetime': [self._format_datetime(dt) for dt in departure_datetimes],
+            'arrival_datetime': [self._format_datetime(dt) for dt in arrival_datetimes],
+            'departure_gate_number': self.fake.gate_numbers(n),
+            'destination_gate_number': self.fake.gate_numbers(n),
+            'plane_registration': self._unique_plane_registrations(n),
+            'price': [_flight_price(distance_km, rng=self._rng) for distance_km, _ in legs],
+        }
+
     def _create_passenger(self) -> Dict[str, Any]:
         """Create a passenger entity with fake data."""
         return {
             "passenger": {
                 'flight_number': self.fake.flight_number(),
                 'fare_type': self.fake.fare_type(),
-                'national_id': self.fake.unique.ssn(),
+                'national_id': self._unique_ssns(1)[0],
                 'name': self.fake.first_name(),
                 'surname': self.fake.last_name(),
-                'email': self.fake.unique.email(),
-                'phone': self.fake.unique.phone_number(),
+                'email': self._unique_email(),
+                'phone': self._unique_phone_numbers(1)[0],
                 'gender': self.fake.gender(),
                 'disabled': False,
                 'seat': self.fake.seat_number(),
@@ -170,47 +397,72 @@ class EntityFactory:
     def _create_creditcard(self) -> Dict[str, Any]:
         """Create a credit card entity with fake data."""
         return {
-            "card_number": self.fake.unique.credit_card_number()[:16],
+            "card_number": self._unique_card_numbers(1)[0],
             "card_type": 'visa',
             "card_holder_name": self.fake.first_name(),
             "card_holder_surname": self.fake.last_name(),
-            "expiration_month": random.randint(1, 12),
-            "expiration_year": random.randint(28, 40),
-            "cvv": self.fake.credit_card_security_code(),
+            "expiration_month": self._choice(_EXPIRATION_MONTHS),
+            "expiration_year": self._choice(_EXPIRATION_YEARS),
+            "cvv": self.fake.cvv(),
+        }
+
+    def _create_creditcard_batch(self, n: int) -> Dict[str, List[Any]]:
+        """Create the columns of n credit card entities, drawing each random field for the whole batch at once."""
+        return {
+            "card_number": self._unique_card_numbers(n),
+            "card_type": ['visa'] * n,
+            "card_holder_name": self.fake.first_names(n),
+            "card_holder_surname": self.fake.last_names(n),
+            "expiration_month": self._choices(_EXPIRATION_MONTHS, k=n),
+            "expiration_year": self._choices(_EXPIRATION_YEARS, k=n),
+            "cvv": self.fake.cvvs(n),
         }
 
     def _create_plane(self) -> Dict[str, Any]:
         """Create a plane entity with fake data."""
         return {
-            'registration': self.fake.unique.bothify("TC-###"),
+            'registration': self._unique_numeric_plane_registrations(1)[0],
             'model': '787',
             'manufacturer': 'Boeing',
             'capacity': 270,
-            'status': random.choice(['active', 'inactive'])
+            'status': self._choice(_PLANE_STATUSES),
+        }
+
+    def _create_plane_batch(self, n: int) -> Dict[str, List[Any]]:
+        """Create the columns of n plane entities, drawing each random field for the whole batch at once."""
+        return {
+            'registration': self._unique_numeric_plane_registrations(n),
+            'model': ['787'] * n,
+            'manufacturer': ['Boeing'] * n,
+            'capacity': [270] * n,
+            'status': self._choices(_PLANE_STATUSES, k=n),
         }
 
     def _create_user(self) -> Dict[str, Any]:
         """Create a user entity with fake data."""
-        now = datetime.now()
         return {
             'name': self.fake.first_name(),
             'surname': self.fake.last_name(),
-            'email': self.fake.unique.email(),
+            'email': self._unique_email(),
             'password': self.fake.password(),
-            'phone': self.fake.unique.phone_number(),
+            'phone': self._unique_phone_numbers(1)[0],
             'gender': self.fake.gender(),
             'birth_date': self._format_datetime(self.fake.birth_date()),
         }
 
+    def _create_user_batch(self, n: int) -> Dict[str, List[Any]]:
+        """Create the columns of n user entities, drawing the names and genders for the whole batch at once."""
+        return {
+            'name': self.fake.first_names(n),
+            'surname': self.fake.last_names(n),
+            'email': self._unique_emails(n),
+            'password': [self.fake.password() for _ in repeat(None, n)],
+            'phone': self._unique_phone_numbers(n),
+            'gender': self.fake.genders(n),
+            'birth_date': [self._format_datetime(dt) for dt in self.fake.birth_dates(n)],
+        }
+
     def _format_datetime(self, dt: datetime) -> str:
         """Formats the given datetime to the accepted one by AMS."""
-        dt = datetime(
-            dt.year,
-            dt.month,
-            dt.day,
-            dt.hour,
-            dt.minute,
-            dt.second,
-        )
-
-        return dt.isoformat('T', "seconds") + 'Z'
+        # Truncates to whole seconds without building an intermediate datetime
+        return dt.isoformat('T', 'seconds') + 'Z'
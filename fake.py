@@ -1,58 +1,178 @@
 from faker import Faker
+from faker.exceptions import UniquenessException
 from datetime import datetime, timedelta
-import random
+from string import ascii_letters, ascii_uppercase
+from typing import Sequence, TypeVar
+
+T = TypeVar('T')
+
+# Card numbers without their Luhn check digit: a visa 4 followed by 14 digits, as every card is a visa
+_CARD_NUMBER_BODIES = range(4 * 10**14, 5 * 10**14)
+
+# Phone numbers are "+905" followed by 20-99 and 2000000-9999999, see _format_phone_number
+_PHONE_NUMBER_COUNT = 80 * 8_000_000
+
+# The first nine digits of a TC kimlik number, the last two are check digits
+_SSN_BASES = range(10**8, 10**9)
+
+# Choice populations, built once instead of per call
+_CARD_TYPES = ('visa', 'mastercard')
+_STATUSES = ('active', 'inactive')
+_GENDERS = ('male', 'female')
+_ROLES = ('hr', 'admin', 'flight_planner', 'passenger_services', 'ground_services')
+_FLIGHT_STATUSES = ('scheduled', 'delayed', 'cancelled', 'departed', 'arrived')
+_MEALS = ('standard', 'vegetarian', 'vegan', 'halal', 'kosher')
+_FARE_TYPES = ('essentials', 'advantage', 'comfort')
+_AIRPORTS = ('IST', 'SAW', 'ESB', 'AYT', 'ADB')
+
+# Every possible gate number and CVV, so drawing one is a single index
+_GATE_NUMBERS = tuple(f"{a}{b}{n:02d}" for a in 'ABCD' for b in 'ABCD' for n in range(100))
+_CVVS = tuple(f"{n:03d}" for n in range(1000))
+_FLIGHT_NUMBERS = tuple(f"CJ-{n:04d}" for n in range(10000))
+_PLANE_REGISTRATIONS = tuple(f"TC-{a}{b}{c}" for a in ascii_uppercase for b in ascii_uppercase for c in ascii_uppercase)
+_NUMERIC_PLANE_REGISTRATIONS = tuple(f"TC-{n:03d}" for n in range(1000))
+
+# Birth dates are drawn between these ages
+_MIN_AGE = timedelta(days=365.25 * 18)
+_MAX_AGE = timedelta(days=365.25 * 50)
+
+# Start of the day this module was imported on
+_TODAY = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+# Daily departure slots every 45 minutes from 08:00 to 23:45, anchored to today
+_FIRST_DEPARTURE = _TODAY.replace(hour=8)
+_DEPARTURE_TIMES = tuple(_FIRST_DEPARTURE + timedelta(minutes=45 * i) for i in range(22))
+
+def _format_phone_number(index: int) -> str:
+    # Same digits as numerify("+905$#$######"), where $ is 2-9 and # is 0-9
+    return f"+905{20 + index // 8_000_000}{2_000_000 + index % 8_000_000}"
+
+def _format_card_number(body: int) -> str:
+    # 15 digits followed by their Luhn check digit, doubling every other digit from the right
+    digits = f"{body:015d}"
+    total = 0
+    for i, d in enumerate(reversed(digits)):
+        d = int(d)
+        if i % 2 == 0:
+            d = d * 2 - 9 if d > 4 else d * 2
+        total += d
+    return f"{digits}{-total % 10}"
+
+def _format_ssn(base: int) -> str:
+    # Check digits of a TC kimlik number, as computed by Faker's tr_TR ssn provider
+    digits = [int(d) for d in str(base)]
+    tenth = (sum(digits[0::2]) * 7 - sum(digits[1::2])) % 10
+    eleventh = (sum(digits) + tenth) % 10
+    return f"{base}{tenth}{eleventh}"
 
 class DatagenFaker(Faker):
-    # Cache for departure times
-    _departure_times = None
-
-    def __init__(self):
+    def __init__(self, reproducible: bool = False):
+        """
+        Initialize the faker, with reproducible set to draw dates relative to the start of today
+        instead of the current time, so that a seeded faker repeats them within the same day.
+        """
         super().__init__("tr_TR")
-
-    @classmethod
-    def _generate_departure_times(cls) -> list[datetime]:
-        if cls._departure_times is None:
-            times = []
-            base_time = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
-            current_time = base_time
-            
-            # Generate times from 08:00 to 23:45
-            while current_time.day - base_time.day < 1:
-                times.append(current_time)
-                current_time += timedelta(minutes=45)
-            
-            cls._departure_times = times
-        return cls._departure_times
+        self._reproducible = reproducible
+        person = self.provider('faker.providers.person')
+        self._first_names = person.first_names
+        self._last_names = person.last_names
+        # Values handed out by unique_sample, per name
+        self._unique_seen: dict[str, set] = {}
+
+    def unique_sample(self, name: str, population: Sequence[T], n: int) -> list[T]:
+        """
+        Draw n distinct members of population that haven't been drawn under name before.
+
+        Unlike Faker's unique proxy this samples the whole batch at once and only
+        redraws the few values that collide with earlier draws.
+        """
+        seen = self._unique_seen.setdefault(name, set())
+        if n > len(population) - len(seen):
+            raise UniquenessException(f"Not enough unique {name} values left to draw {n}.")
+
+        values = []
+        while len(values) < n:
+            for value in self.random.sample(population, n - len(values)):
+                if value not in seen:
+                    seen.add(value)
+                    values.append(value)
+        return values
+
+    def unique_ssns(self, n: int) -> list[str]:
+        return [_format_ssn(base) for base in self.unique_sample('ssn', _SSN_BASES, n)]
+
+    def unique_phone_numbers(self, n: int) -> list[str]:
+        return [_format_phone_number(index) for index in self.unique_sample('phone_number', range(_PHONE_NUMBER_COUNT), n)]
+
+    def unique_card_numbers(self, n: int) -> list[str]:
+        return [_format_card_number(body) for body in self.unique_sample('card_number', _CARD_NUMBER_BODIES, n)]
+
+    def unique_flight_numbers(self, n: int) -> list[str]:
+        return self.unique_sample('flight_number', _FLIGHT_NUMBERS, n)
+
+    def unique_plane_registrations(self, n: int) -> list[str]:
+        return self.unique_sample('plane_registration', _PLANE_REGISTRATIONS, n)
+
+    def unique_numeric_plane_registrations(self, n: int) -> list[str]:
+        return self.unique_sample('numeric_plane_registration', _NUMERIC_PLANE_REGISTRATIONS, n)
 
     def phone_number(self) -> str:
-        return self.numerify("+905$#$######")
+        return _format_phone_number(self.random.randrange(_PHONE_NUMBER_COUNT))
+
+    def first_names(self, n: int) -> list[str]:
+        return self.random.choices(self._first_names, k=n)
+
+    def last_names(self, n: int) -> list[str]:
+        return self.random.choices(self._last_names, k=n)
+
+    def card_number(self) -> str:
+        return _format_card_number(self.random.choice(_CARD_NUMBER_BODIES))
+
+    def cvv(self) -> str:
+        return self.random.choice(_CVVS)
+
+    def cvvs(self, n: int) -> list[str]:
+        return self.random.choices(_CVVS, k=n)
 
     def card_type(self) -> str:
-        return self.random_choices(elements=['visa', 'mastercard'], length=1)[0]
+        return self.random.choice(_CARD_TYPES)
 
     def status(self) -> str:
-        return self.random_choices(elements=['active', 'inactive'], length=1)[0]
+        return self.random.choice(_STATUSES)
 
     def gender(self) -> str:
-        return self.random_choices(elements=['male', 'female'], length=1)[0]
+        return self.random.choice(_GENDERS)
+
+    def genders(self, n: int) -> list[str]:
+        return self.random.choices(_GENDERS, k=n)
 
     def role(self) -> str:
-        return self.random_choices(elements=['hr', 'admin', 'flight_planner', 'passenger_services', 'ground_services'], length=1)[0]
+        return self.random.choice(_ROLES)
+
+    def roles(self, n: int) -> list[str]:
+        return self.random.choices(_ROLES, k=n)
 
     def flight_status(self) -> str:
-        return self.random_choices(elements=['scheduled', 'delayed', 'cancelled', 'departed', 'arrived'], length=1)[0]
+        return self.random.choice(_FLIGHT_STATUSES)
 
     def meal(self) -> str:
-        return self.random_choices(elements=['standard', 'vegetarian', 'vegan', 'halal', 'kosher'], length=1)[0]
+        return self.random.choice(_MEALS)
 
     def fare_type(self) -> str:
-        return self.random_choices(elements=['essentials', 'advantage', 'comfort'], length=1)[0]
+        return self.random.choice(_FARE_TYPES)
 
     def title(self) -> str:
         return self.job()
 
-    def birth_date(self) -> str:
-        return self.date_time_between(start_date='-50y', end_date='-18y')
+    def birth_date(self) -> datetime:
+        return self.birth_dates(1)[0]
+
+    def birth_dates(self, n: int) -> list[datetime]:
+        # Resolve the age bounds against the clock once for the whole batch
+        start = (_TODAY if self._reproducible else datetime.now()) - _MAX_AGE
+        span = (_MAX_AGE - _MIN_AGE).total_seconds()
+        uniform = self.random.uniform
+        return [start + timedelta(seconds=uniform(0, span)) for _ in range(n)]
 
     def hire_date(self) -> str:
         return self.date_time_between(start_date='-2y', end_date='now')
@@ -64,19 +184,19 @@ class DatagenFaker(Faker):
         return self.random_int(min=0, max=30)
 
     def baggage_id(self) -> str:
-        return self.bothify(text='BAG#####KG')
+        return f"BAG{self.random.randrange(100_000):05d}KG"
 
     def extra_baggage(self) -> int:
         return self.random_int(min=0, max=2)
     
     def pnr(self) -> str:
-        return self.bothify(text='??????')
+        return ''.join(self.random.choices(ascii_letters, k=6))
     
     def salary(self) -> float:
         return self.random_int(30000, 150000)
 
     def employee_id(self) -> str:
-        return self.bothify(text='EMP####')
+        return f"EMP{self.random.randrange(10_000):04d}"
         
     def flight_id(self) -> str:
         return self.random_int(1, 1000)
@@ -85,20 +205,27 @@ class DatagenFaker(Faker):
         return self.random_int(1, 1000)
 
     def gate_number(self) -> str:
-        return self.bothify("??##", letters="ABCD")
+        return self.random.choice(_GATE_NUMBERS)
+
+    def gate_numbers(self, n: int) -> list[str]:
+        return self.random.choices(_GATE_NUMBERS, k=n)
 
     def plane_registration(self) -> str:
-        return self.bothify("TC-???").upper()
+        return self.random.choice(_PLANE_REGISTRATIONS)
+
+    def numeric_plane_registration(self) -> str:
+        return self.random.choice(_NUMERIC_PLANE_REGISTRATIONS)
 
     def flight_price(self) -> int:
         return self.random_int(100, 2000)
 
     def flight_number(self) -> str:
-        return self.numerify(f"CJ-####")
+        return self.random.choice(_FLIGHT_NUMBERS)
 
-    def iata(self, exclude=[]) -> str:
-        return self.random_choices(elements=set(['IST', 'SAW', 'ESB', 'AYT', 'ADB']) - set(exclude), length=1)[0]
+    def iata(self, exclude: tuple[str, ...] = ()) -> str:
+        airports = [airport for airport in _AIRPORTS if airport not in exclude] if exclude else _AIRPORTS
+        return self.random.choice(airports)
 
     def departure_datetime(self) -> datetime:
-        delta = random.randint(1, 21)
-        return random.choice(DatagenFaker._generate_departure_times()) + timedelta(days=delta)
+        delta = self.random.randint(1, 21)
+        return self.random.choice(_DEPARTURE_TIMES) + timedelta(days=delta)
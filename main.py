@@ -1,48 +1,68 @@
 import argparse
+import atexit
 import logging
+import logging.handlers
+import queue
 from dotenv import load_dotenv
 import os
 import json
+import sys
 
 from entity import Entity, EntityFactory
 from router import Router
-from scheme import StandardScheme
+from scheme import execute_scheme, standard_scheme
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+# Configure logging, writing records from a background thread so logging calls only enqueue them
+log_queue = queue.SimpleQueue()
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter(
+    fmt='%(asctime)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+log_listener.start()
+atexit.register(log_listener.stop)
 
 # Base URL for the API from environment variables
 BASE_URL = os.getenv('BASE_URL')
 
+# Whether the API accepts gzip encoded request bodies
+GZIP_REQUESTS = os.getenv('GZIP_REQUESTS', 'false').lower() == 'true'
+
+# Entity names accepted by --entity, for the help text
+ENTITY_CHOICES = "|".join(e.name.lower() for e in Entity)
+
 factory = EntityFactory()
-router = Router(BASE_URL)
-scheme = StandardScheme(factory, router)
+router = Router(BASE_URL, gzip_requests=GZIP_REQUESTS)
 
-def run_generate_dry_run(entity_type: Entity, amount: int):
+def run_generate_dry_run(entity_type: Entity, amount: int, workers: int = 1):
     logging.info("Dry run mode - displaying generated data:")
-    entities = factory.create_entities(entity_type, amount)
+    entities = factory.create_entities(entity_type, amount, workers)
     print(json.dumps(entities, indent=2, ensure_ascii=False))
 
-def run_generate(entity_type: Entity, amount: int) -> None:
-    logging.info(f"Generating f{amount} entities of {entity_type}")
-    entities = factory.create_entities(entity_type, amount)
+def run_generate(entity_type: Entity, amount: int, workers: int = 1) -> None:
+    logging.info("Generating %d entities of %s", amount, entity_type.name)
+    entities = factory.create_entities(entity_type, amount, workers)
     router.post(entity_type, entities)
 
 def run_scheme_dry_run():
     logging.info("Dry run mode - displaying the scheme generation:")
-    for entity, data in scheme:
-        logging.info(f"Generated entity: {entity.name}, data: {json.dumps(data, indent=2, ensure_ascii=False)}")
+    # Write each stage to stdout as one JSON line as soon as it's generated
+    for entity, data in standard_scheme(factory):
+        logging.info("Generated %d number of %s with scheme", len(data), entity.name)
+        sys.stdout.write(json.dumps({'entity': entity.name, 'data': data}, ensure_ascii=False))
+        sys.stdout.write('\n')
+        del data
+    sys.stdout.flush()
 
 def run_scheme():
     logging.info("Executing the standard generation scheme.")
-    scheme.execute()
+    execute_scheme(standard_scheme(factory), router)
 
 def main():
     parser = argparse.ArgumentParser(description='Entity processing CLI')
@@ -58,7 +78,7 @@ def main():
         '-e', '--entity',
         type=str,
         required=True,
-        help=f'Entity to process ({"|".join([e.name.lower() for e in Entity])})'
+        help=f'Entity to process ({ENTITY_CHOICES})'
     )
     generate_parser.add_argument(
         '-a', '--amount',
@@ -71,6 +91,12 @@ def main():
         action='store_true',
         help='Generate data without making HTTP requests'
     )
+    generate_parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=1,
+        help=f'Worker processes to generate with, e.g. {os.cpu_count()} (default: 1)'
+    )
 
     scheme_parser.add_argument(
         '-d', '--dry-run',
@@ -89,12 +115,14 @@ def main():
         elif args.command == 'generate':
             entity = Entity.from_string(args.entity)
             if args.dry_run:
-                run_generate_dry_run(entity, args.amount)
+                run_generate_dry_run(entity, args.amount, args.workers)
             else:
-                run_generate(entity, args.amount)
+                run_generate(entity, args.amount, args.workers)
     except ValueError as e:
-        logging.error(f"Error: {e}")
+        logging.error("Error: %s", e)
         return 1
+    finally:
+        router.close()
 
     return 0
 
@@ -1,17 +1,35 @@
+import gzip
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Any
 from entity import Entity
 
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+_GZIP_JSON_HEADERS = {**_JSON_HEADERS, 'Content-Encoding': 'gzip'}
+
 class Router:
-    def __init__(self, base_url: str):
+    # Larger payloads are split into posts of at most this many entities
+    CHUNK_SIZE = 500
+
+    # Smallest request body worth compressing when compression is enabled
+    GZIP_MIN_SIZE = 16 * 1024
+
+    def __init__(self, base_url: str, max_workers: int = 8, gzip_requests: bool = False):
         """
         Initialize the Router with a base URL.
         
         Args:
             base_url (str): The base URL for all API requests
+            max_workers (int): The most chunks of a single post sent at once
+            gzip_requests (bool): Whether to gzip request bodies of at least GZIP_MIN_SIZE bytes,
+                only for servers that accept gzip encoded requests
         """
         self.base_url = base_url.rstrip('/')
+        self.gzip_requests = gzip_requests
         self.endpoints = {
             Entity.CREDITCARD: "/creditcards",
             Entity.EMPLOYEE: "/employees",
@@ -20,33 +38,83 @@ class Router:
             Entity.PLANE: "/planes",
             Entity.USER: "/users",
         }
+        self.urls = {entity_type: f"{self.base_url}{endpoint}" for entity_type, endpoint in self.endpoints.items()}
+
+        # Reuse connections across posts instead of opening a new one per request
+        self.session = requests.Session()
+        # Retry POSTs only when connecting failed or the API turned them away without taking the batch.
+        # Read errors and 5xx gateway or server errors may follow a batch that was already stored, so they aren't retried.
+        retry = Retry(
+            total=5,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[429, 503],
+            allowed_methods=['POST'],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Sends the chunks of a post concurrently, each over its own pooled connection
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def close(self) -> None:
+        """Stop the chunk senders and close the pooled connections of the underlying session."""
+        self.executor.shutdown()
+        self.session.close()
+
+    def __enter__(self) -> 'Router':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def post(self, entity_type: Entity, data: List[Dict[str, Any]]) -> requests.Response:
         """
         Send a POST request to the corresponding entity endpoint with the provided data.
+
+        Data longer than CHUNK_SIZE is sent as concurrent POST requests of at most
+        CHUNK_SIZE entities each. All of them have finished when this returns.
         
         Args:
             entity_type (Entity): The type of entity to post
             data (List[Dict[str, Any]]): Array of JSON objects to send
             
         Returns:
-            requests.Response: The response from the server
+            requests.Response: The response from the server to the request with the last chunk
             
         Raises:
             ValueError: If the entity type is not supported
-            requests.exceptions.RequestException: If the request fails
+            requests.exceptions.RequestException: If a request fails
         """
-        endpoint = self.endpoints.get(entity_type)
-        if endpoint is None:
+        url = self.urls.get(entity_type)
+        if url is None:
             raise ValueError(f"No endpoint found for entity: {entity_type.name}")
             
-        url = f"{self.base_url}{endpoint}"
+        chunk_size = self.CHUNK_SIZE
+        chunks = [data[start:start + chunk_size] for start in range(0, len(data), chunk_size)] or [data]
 
-        logging.info(f"Sending POST request to {url}")
+        # Wait for every chunk, so entities posted after this call can rely on these being stored
+        futures = [self.executor.submit(self._post_chunk, url, chunk) for chunk in chunks]
+        wait(futures)
+        responses = [future.result() for future in futures]
 
-        response = requests.post(url, json=data, params={'batch': 'true'})
-        response.raise_for_status()  # Raise an exception for bad status codes
+        logging.info("POST %s request successful", url)
 
-        logging.info(f"POST {url} request successful")
+        return responses[-1]
+
+    def _post_chunk(self, url: str, chunk: List[Dict[str, Any]]) -> requests.Response:
+        logging.info("Sending POST request with %d entities to %s", len(chunk), url)
+
+        # Serialize without the whitespace requests' json= adds after separators
+        body = json.dumps(chunk, separators=(',', ':'), allow_nan=False).encode()
+        headers = _JSON_HEADERS
+        if self.gzip_requests and len(body) >= self.GZIP_MIN_SIZE:
+            # The fastest level already shrinks this repetitive JSON several times over
+            body = gzip.compress(body, compresslevel=1)
+            headers = _GZIP_JSON_HEADERS
+        response = self.session.post(url, data=body, headers=headers, params={'batch': 'true'})
+        response.raise_for_status()  # Raise an exception for bad status codes
 
         return response
\ No newline at end of file
@@ -1,99 +1,92 @@
 import random
-from typing import Iterator, List, Dict, Any
-from entity import Entity, EntityFactory
+from typing import Iterable, Iterator, List, Dict, Any, Tuple
+from entity import Entity, EntityFactory, soa_to_aos
 from router import Router
 import logging
-from collections import defaultdict
 
-class BaseScheme:
-    def __init__(self):
-        self.scheme = self.build()
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        return next(self.scheme)
-
-    def build(self):
-        raise NotImplementedError("Subclasses should implement this method.") 
-
-    def execute(self):
-        raise NotImplementedError("Subclasses should implement this method.") 
-
-
-class StandardScheme(BaseScheme):
-    NUM_USERS = 1000 
-    NUM_CREDITCARDS = NUM_USERS
-    NUM_PLANES = 500 
-    NUM_FLIGHTS = 5000
-    NUM_PASSENGERS = NUM_FLIGHTS
-
-    # NUM_USERS = 1
-    # NUM_CREDITCARDS = NUM_USERS
-    # NUM_PLANES = 1 
-    # NUM_FLIGHTS = 1
-    # NUM_PASSENGERS = NUM_FLIGHTS * 100
-
-    def __init__(self, factory: EntityFactory, router: Router):
-        super().__init__()
-        self.factory = factory
-        self.router = router
-
-    def build(self):
-        # Create employees
-        # yield Entity.EMPLOYEE, self.factory.create_entities(Entity.EMPLOYEE, 0)
-
-        # Create users
-        user_overrides = { 'password': '123' }
-        users = self.factory.create_entities(Entity.USER, StandardScheme.NUM_USERS, **user_overrides)
-        yield Entity.USER, users
-
-        # Create credit cards
-        credit_cards = []
-        for i in range(0, StandardScheme.NUM_CREDITCARDS):
-            credit_card_overrides = { 'card_holder_name': users[i]['name'], 'card_holder_surname': users[i]['surname'] }
-            credit_card = self.factory.create_entity(Entity.CREDITCARD, **credit_card_overrides)
-            credit_cards.append(credit_card)
-
-        yield Entity.CREDITCARD, credit_cards
-
-        # Create planes
-        planes = self.factory.create_entities(Entity.PLANE, StandardScheme.NUM_PLANES)
-        yield Entity.PLANE, planes
-
-        # Create flights
-        flights = []
-        for _ in range(0, StandardScheme.NUM_FLIGHTS):
-            flight_overrides = { 'plane_registration': random.choice(planes)['registration'] }
-            flight = self.factory.create_entity(Entity.FLIGHT, **flight_overrides)
-            flights.append(flight)
-
-        yield Entity.FLIGHT, flights
-
-        # Create passengers
-        all_seats = defaultdict(lambda: iter(range(0, 200)))
-        passengers = []
-        for _ in range(0, StandardScheme.NUM_PASSENGERS):
-            credit_card = random.choice(credit_cards)
-            flight = random.choice(flights)
-            seats = all_seats[flight['flight_number']]
-            seat = next(seats)
-
-            passenger_overrides = {
-                'passenger': {
-                    'flight_number': flight['flight_number'],
-                    'seat': seat
-                },
-                'credit_card': credit_card
-            }
-
-            passenger = self.factory.create_entity(Entity.PASSENGER, **passenger_overrides)
-            passengers.append(passenger)
-
-        yield Entity.PASSENGER, passengers
-
-    def execute(self) -> None:
-        for entity, data in self:
-            logging.info(f"Posting {len(data)} number of {entity.name} generated with scheme")
-            self.router.post(entity, data)
\ No newline at end of file
+NUM_USERS = 1000 
+NUM_CREDITCARDS = NUM_USERS
+NUM_PLANES = 500 
+NUM_FLIGHTS = 5000
+NUM_PASSENGERS = NUM_FLIGHTS
+NUM_SEATS = 200
+
+# NUM_USERS = 1
+# NUM_CREDITCARDS = NUM_USERS
+# NUM_PLANES = 1 
+# NUM_FLIGHTS = 1
+# NUM_PASSENGERS = NUM_FLIGHTS * 100
+
+def standard_scheme(factory: EntityFactory) -> Iterator[Tuple[Entity, List[Dict[str, Any]]]]:
+    """Generate the standard data set stage by stage, yielding each entity type with its entities in posting order."""
+    # Create employees
+    # yield Entity.EMPLOYEE, factory.create_entities(Entity.EMPLOYEE, 0)
+
+    # Create users
+    user_columns = factory.create_entities_soa(Entity.USER, NUM_USERS)
+    user_columns['password'] = ['123'] * NUM_USERS
+    # Credit cards only need the users' names, so keep those columns rather than the user rows
+    card_holder_names = user_columns['name'][:NUM_CREDITCARDS]
+    card_holder_surnames = user_columns['surname'][:NUM_CREDITCARDS]
+    yield Entity.USER, soa_to_aos(user_columns)
+
+    # Create credit cards
+    # Each stage only keeps what later stages need, so finished stages can be freed once posted
+    del user_columns
+    credit_card_columns = factory.create_entities_soa(Entity.CREDITCARD, NUM_CREDITCARDS)
+    credit_card_columns['card_holder_name'] = card_holder_names
+    credit_card_columns['card_holder_surname'] = card_holder_surnames
+    credit_cards = soa_to_aos(credit_card_columns)
+    del credit_card_columns, card_holder_names, card_holder_surnames
+
+    yield Entity.CREDITCARD, credit_cards
+
+    # Create planes
+    planes = factory.create_entities(Entity.PLANE, NUM_PLANES)
+    yield Entity.PLANE, planes
+
+    # Create flights
+    plane_registrations = random.choices([plane['registration'] for plane in planes], k=NUM_FLIGHTS)
+    del planes
+    flight_overrides = [{ 'plane_registration': registration } for registration in plane_registrations]
+    flights = factory.create_entities_with_overrides(Entity.FLIGHT, flight_overrides)
+
+    yield Entity.FLIGHT, flights
+
+    # Create passengers
+    flight_numbers = [flight['flight_number'] for flight in flights]
+    del flights
+    passenger_flight_numbers = random.choices(flight_numbers, k=NUM_PASSENGERS)
+    passenger_credit_cards = random.choices(credit_cards, k=NUM_PASSENGERS)
+    del credit_cards
+
+    # Next free seat per flight, wrapping around once a flight is full
+    next_seats = dict.fromkeys(flight_numbers, 0)
+    seats = []
+    for flight_number in passenger_flight_numbers:
+        seat = next_seats[flight_number]
+        next_seats[flight_number] = (seat + 1) % NUM_SEATS
+        seats.append(seat)
+
+    passenger_overrides = [
+        {
+            'passenger': {
+                'flight_number': flight_number,
+                'seat': seat
+            },
+            'credit_card': credit_card
+        }
+        for flight_number, seat, credit_card in zip(passenger_flight_numbers, seats, passenger_credit_cards)
+    ]
+    passengers = factory.create_entities_with_overrides(Entity.PASSENGER, passenger_overrides)
+    del passenger_credit_cards, passenger_overrides
+
+    yield Entity.PASSENGER, passengers
+
+def execute_scheme(scheme: Iterable[Tuple[Entity, List[Dict[str, Any]]]], router: Router) -> None:
+    """Post every stage of the scheme, each one once the previous has been posted."""
+    for entity, data in scheme:
+        logging.info("Posting %d number of %s generated with scheme", len(data), entity.name)
+        router.post(entity, data)
+        # Drop the posted stage before the next one is generated
+        del data
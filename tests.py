@@ -1,7 +1,9 @@
 import pytest
-from entity import Entity, EntityFactory
+from entity import Entity, EntityFactory, soa_to_aos
 from router import Router
+from fake import DatagenFaker
 import os
+import re
 from dotenv import load_dotenv
 
 # Load environment variables from a .env file
@@ -12,8 +14,8 @@ def setup():
     # Setup code for integration tests
     base_url = os.getenv('BASE_URL')
     factory = EntityFactory()
-    router = Router(base_url)
-    yield factory, router
+    with Router(base_url) as router:
+        yield factory, router
 
     # Cleanup code for integration tests go after this line
     pass
@@ -27,3 +29,68 @@ def test_router_post(setup, entity_type):
         assert response.status_code == 200, f"Failed with status code {response.status_code}: {response.text}"
     except Exception as e:
         pytest.fail(str(e))
+
+def test_create_entity_merges_nested_overrides():
+    factory = EntityFactory()
+    entity = factory.create_entity(Entity.PASSENGER, passenger={'seat': 7})
+    assert entity['passenger']['seat'] == 7
+    assert 'national_id' in entity['passenger']
+
+@pytest.mark.parametrize("entity_type", [Entity.PLANE, Entity.USER])
+def test_create_entities_soa_round_trip(entity_type):
+    factory = EntityFactory()
+    columns = factory.create_entities_soa(entity_type, 3)
+    rows = soa_to_aos(columns)
+    assert len(rows) == 3
+    assert all(set(row) == set(columns) for row in rows)
+
+@pytest.mark.parametrize("entity_type", [Entity.FLIGHT, Entity.USER, Entity.EMPLOYEE, Entity.PASSENGER])
+def test_seeded_factories_are_reproducible(entity_type):
+    first = EntityFactory(seed=42).create_entities(entity_type, 5)
+    second = EntityFactory(seed=42).create_entities(entity_type, 5)
+    assert first == second
+
+def test_entity_from_string():
+    assert Entity.from_string('Flight') is Entity.FLIGHT
+    with pytest.raises(ValueError):
+        Entity.from_string('bank')
+
+def test_unique_sample_holds_across_batches():
+    fake = DatagenFaker()
+    flight_numbers = fake.unique_flight_numbers(6000) + fake.unique_flight_numbers(4000)
+    assert len(set(flight_numbers)) == 10000
+
+def test_card_numbers_pass_luhn_check():
+    for card_number in DatagenFaker().unique_card_numbers(100):
+        digits = [int(d) for d in reversed(card_number)]
+        total = sum(digits[0::2]) + sum(sum(divmod(d * 2, 10)) for d in digits[1::2])
+        assert len(card_number) == 16 and card_number.startswith('4') and total % 10 == 0
+
+def test_create_entities_with_overrides():
+    factory = EntityFactory()
+    overrides = [{'card_holder_name': 'Ada'}, {'card_holder_name': 'Grace', 'cvv': '000'}]
+    credit_cards = factory.create_entities_with_overrides(Entity.CREDITCARD, overrides)
+    assert [card['card_holder_name'] for card in credit_cards] == ['Ada', 'Grace']
+    assert credit_cards[1]['cvv'] == '000'
+
+@pytest.mark.parametrize("entity_type, unique_keys", [
+    (Entity.PLANE, [('registration',)]),
+    (Entity.FLIGHT, [('flight_number',), ('plane_registration',)]),
+    (Entity.PASSENGER, [('passenger', 'national_id'), ('passenger', 'email'), ('passenger', 'phone'), ('credit_card', 'card_number')]),
+])
+def test_parallel_entities_are_unique_across_shards(entity_type, unique_keys):
+    entities = EntityFactory(seed=1).create_entities(entity_type, 1000, workers=2)
+    assert len(entities) == 1000
+    for path in unique_keys:
+        values = set()
+        for entity in entities:
+            for key in path:
+                entity = entity[key]
+            values.add(entity)
+        assert len(values) == len(entities), f"Duplicate values of {'.'.join(path)}"
+
+def test_phone_numbers_match_faker_format():
+    # numerify("+905$#$######"), where $ is 2-9
+    pattern = re.compile(r"\+905[2-9][0-9][2-9][0-9]{6}")
+    for phone_number in DatagenFaker().unique_phone_numbers(1000):
+        assert pattern.fullmatch(phone_number)